@@ -9,8 +9,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 
 from .config_flow import configured_instances
-from .const import DATA_CLIENT, DATA_CONFIG, DOMAIN, SERVICE_SET_ACTIVE_CONTROL
-from .services import async_register_services
+from .const import DATA_CLIENT, DATA_CONFIG, DATA_SCHEDULES, DOMAIN
+from .services import async_register_services, async_unregister_services
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -65,16 +65,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
 
     await hass.config_entries.async_forward_entry_setups(config_entry, NGENIC_PLATFORMS)
 
+    # Reload when the options are changed
+    config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+    """Reload the Ngenic component."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Unload of the Ngenic component."""
 
     await hass.config_entries.async_unload_platforms(config_entry, NGENIC_PLATFORMS)
     await hass.data[DOMAIN][DATA_CLIENT].async_close()
 
+    # Drop the away schedules shared by the entities
+    hass.data[DOMAIN].pop(DATA_SCHEDULES, None)
+
     # Remove Ngenic services
-    hass.services.async_remove(DOMAIN, SERVICE_SET_ACTIVE_CONTROL)
+    async_unregister_services(hass)
 
     return True
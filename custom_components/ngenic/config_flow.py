@@ -11,7 +11,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_TOKEN
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN
+from .const import DEFAULT_SCAN_INTERVALS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +32,14 @@ class FlowHandler(config_entries.ConfigFlow):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_PUSH
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     def _show_form(self, error: str | None = None):
         return self.async_show_form(
             step_id="user",
@@ -67,3 +75,30 @@ class FlowHandler(config_entries.ConfigFlow):
                 return self._show_form("bad_token")
 
         return self._show_form()
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the options for Ngenic integration."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        """Manage the sensor update intervals."""
+
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(option, default=options.get(option, default)): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    )
+                    for option, default in DEFAULT_SCAN_INTERVALS.items()
+                }
+            ),
+        )
@@ -7,6 +7,8 @@ DOMAIN: Final[str] = "ngenic"
 BRAND: Final[str] = "Ngenic"
 DATA_CLIENT: Final[str] = "data_client"
 DATA_CONFIG: Final[str] = "config"
+DATA_SERVICES_REGISTERED: Final[str] = "services_registered"
+DATA_SCHEDULES: Final[str] = "schedules"
 UPDATE_SCHEDULE_TOPIC: Final = f"{DOMAIN}_schedule_update"
 SERVICE_SET_ACTIVE_CONTROL: Final[str] = "set_active_control"
 SERVICE_SET_AWAY_SCHEDULE: Final[str] = "set_away_schedule"
@@ -21,3 +23,19 @@ From API doc: Tune system Nodes generally report data in intervals of five
 minutes, so there is no point in polling the API for new data at a higher rate.
 """
 SCAN_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+
+"""
+Sensor update intervals (in minutes) that can be changed in the integration options.
+"""
+CONF_SCAN_INTERVAL_BATTERY: Final[str] = "scan_interval_battery"
+CONF_SCAN_INTERVAL_CURRENT: Final[str] = "scan_interval_current"
+CONF_SCAN_INTERVAL_ENERGY: Final[str] = "scan_interval_energy"
+CONF_SCAN_INTERVAL_ENERGY_THIS_MONTH: Final[str] = "scan_interval_energy_this_month"
+CONF_SCAN_INTERVAL_ENERGY_LAST_MONTH: Final[str] = "scan_interval_energy_last_month"
+DEFAULT_SCAN_INTERVALS: Final[dict[str, int]] = {
+    CONF_SCAN_INTERVAL_BATTERY: 5,
+    CONF_SCAN_INTERVAL_CURRENT: 2,
+    CONF_SCAN_INTERVAL_ENERGY: 10,
+    CONF_SCAN_INTERVAL_ENERGY_THIS_MONTH: 20,
+    CONF_SCAN_INTERVAL_ENERGY_LAST_MONTH: 60,
+}
@@ -0,0 +1,70 @@
+"""Away schedule shared by the Ngenic entities of a tune."""
+
+import asyncio
+from time import monotonic
+from typing import Final
+
+from ngenicpy.models.setpoint_schedule import SetpointSchedule
+from ngenicpy.models.tune import Tune
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULES, DOMAIN, SETPONT_SCHEDULE_NAME
+
+# How long (in seconds) a fetched schedule is reused.
+# When the schedule is changed, all away entities are told to update
+# at once, and they will all read the same schedule.
+SCHEDULE_CACHE_TTL: Final[float] = 2.0
+
+
+def _get_schedules(
+    hass: HomeAssistant,
+) -> dict[str, tuple[float, asyncio.Future[SetpointSchedule]]]:
+    """Get the shared schedules, keyed by tune uuid.
+
+    They are kept in hass.data, so they are dropped when the entry is unloaded.
+    """
+    return hass.data[DOMAIN].setdefault(DATA_SCHEDULES, {})
+
+
+async def async_get_away_schedule(
+    hass: HomeAssistant, tune: Tune, invalidate_cache: bool = False
+) -> SetpointSchedule:
+    """Get the away schedule of a tune.
+
+    Concurrent and recent requests for the same tune share a single fetch.
+    """
+    schedules = _get_schedules(hass)
+    tune_uuid = tune.uuid()
+    now = monotonic()
+    cached = schedules.get(tune_uuid)
+    if cached is None or cached[0] <= now:
+        cached = (
+            now + SCHEDULE_CACHE_TTL,
+            hass.async_create_task(
+                tune.async_setpoint_schedule(SETPONT_SCHEDULE_NAME, invalidate_cache)
+            ),
+        )
+        schedules[tune_uuid] = cached
+
+    try:
+        # shielded, so a cancelled caller doesn't cancel the fetch of the others
+        return await asyncio.shield(cached[1])
+    except BaseException:
+        # don't share a failed or cancelled fetch
+        if schedules.get(tune_uuid) is cached:
+            del schedules[tune_uuid]
+        raise
+
+
+async def async_refresh_away_schedule(
+    hass: HomeAssistant, tune: Tune
+) -> SetpointSchedule:
+    """Fetch the away schedule of a tune again after it was written.
+
+    The written schedule isn't shared, as ngenicpy doesn't update it from
+    the response of the API. A schedule that was created has no uuid, so
+    it couldn't be deleted when away mode is deactivated.
+    """
+    _get_schedules(hass).pop(tune.uuid(), None)
+    return await async_get_away_schedule(hass, tune, True)
@@ -8,23 +8,36 @@ from ngenicpy.models.measurement import MeasurementType
 from ngenicpy.models.node import NodeType
 from ngenicpy.models.room import Room
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later
 
-from .const import BRAND, DATA_CLIENT, DOMAIN
+from .const import (
+    BRAND,
+    CONF_SCAN_INTERVAL_BATTERY,
+    CONF_SCAN_INTERVAL_CURRENT,
+    CONF_SCAN_INTERVAL_ENERGY,
+    CONF_SCAN_INTERVAL_ENERGY_LAST_MONTH,
+    CONF_SCAN_INTERVAL_ENERGY_THIS_MONTH,
+    DATA_CLIENT,
+    DEFAULT_SCAN_INTERVALS,
+    DOMAIN,
+)
 from .sensors.away import (
     NgenicAwayModeSensor,
     NgenicAwayScheduledFromSensor,
     NgenicAwayScheduledToSensor,
 )
-from .sensors.base import NgenicSensor
+from .sensors.base import NgenicNodeCoordinator, NgenicSensor, SlimNgenicSensor
 from .sensors.battery import NgenicBatterySensor
 from .sensors.current import NgenicCurrentSensor
-from .sensors.energy import NgenicEnergySensor
-from .sensors.energy_last_month import NgenicEnergyLastMonthSensor
-from .sensors.energy_this_month import NgenicEnergyThisMonthSensor
+from .sensors.energy import (
+    ENERGY_PERIOD_LAST_MONTH,
+    ENERGY_PERIOD_THIS_MONTH,
+    NgenicEnergySensor,
+)
 from .sensors.humidity import NgenicHumiditySensor
 from .sensors.power import NgenicPowerSensor
 from .sensors.signal_strength import NgenicSignalStrengthSensor
@@ -32,13 +45,32 @@ from .sensors.temperature import NgenicTemperatureSensor
 from .sensors.voltage import NgenicVoltageSensor
 
 
+def _get_scan_interval(config_entry: ConfigEntry, option: str) -> timedelta:
+    """Get a sensor update interval from the config entry options."""
+    return timedelta(
+        minutes=config_entry.options.get(option, DEFAULT_SCAN_INTERVALS[option])
+    )
+
+
 async def async_setup_entry(
-    hass: HomeAssistant, _, async_add_entities: AddEntitiesCallback
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
 ):
     """Set up the sensor platform."""
 
     ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
-    devices: list[NgenicSensor] = []
+    battery_interval = _get_scan_interval(config_entry, CONF_SCAN_INTERVAL_BATTERY)
+    current_interval = _get_scan_interval(config_entry, CONF_SCAN_INTERVAL_CURRENT)
+    energy_interval = _get_scan_interval(config_entry, CONF_SCAN_INTERVAL_ENERGY)
+    energy_this_month_interval = _get_scan_interval(
+        config_entry, CONF_SCAN_INTERVAL_ENERGY_THIS_MONTH
+    )
+    energy_last_month_interval = _get_scan_interval(
+        config_entry, CONF_SCAN_INTERVAL_ENERGY_LAST_MONTH
+    )
+    devices: list[SlimNgenicSensor] = []
+    coordinators: list[NgenicNodeCoordinator] = []
 
     for tune in await ngenic.async_tunes():
         rooms = await tune.async_rooms()
@@ -69,6 +101,7 @@ async def async_setup_entry(
         )
 
         for node in await tune.async_nodes():
+            coordinator = NgenicNodeCoordinator(hass, node)
             node_name = f"Ngenic {node.get_type().name}".title()
             node_room: Room = None
             device_model = node.get_type().name.capitalize()
@@ -105,7 +138,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.TEMPERATURE,
                         device_info,
@@ -116,8 +149,9 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        battery_interval,
                         device_info,
                     )
                 )
@@ -126,7 +160,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         device_info,
                     )
@@ -141,7 +175,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.CONTROL_VALUE,
                         device_info,
@@ -154,7 +188,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.HUMIDITY,
                         device_info,
@@ -167,7 +201,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.POWER,
                         device_info,
@@ -180,7 +214,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.PRODUCED_POWER,
                         device_info,
@@ -193,8 +227,9 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        current_interval,
                         MeasurementType.L1_CURRENT,
                         device_info,
                     )
@@ -206,7 +241,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.L1_VOLTAGE,
                         device_info,
@@ -219,8 +254,9 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        current_interval,
                         MeasurementType.L2_CURRENT,
                         device_info,
                     )
@@ -232,7 +268,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.L2_VOLTAGE,
                         device_info,
@@ -245,8 +281,9 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        current_interval,
                         MeasurementType.L3_CURRENT,
                         device_info,
                     )
@@ -258,7 +295,7 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
                         MeasurementType.L3_VOLTAGE,
                         device_info,
@@ -271,32 +308,37 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        energy_interval,
                         MeasurementType.PRODUCED_ENERGY,
                         device_info,
                     )
                 )
                 devices.append(
-                    NgenicEnergyThisMonthSensor(
+                    NgenicEnergySensor(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        energy_this_month_interval,
                         MeasurementType.PRODUCED_ENERGY,
                         device_info,
+                        ENERGY_PERIOD_THIS_MONTH,
                     )
                 )
                 devices.append(
-                    NgenicEnergyLastMonthSensor(
+                    NgenicEnergySensor(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        energy_last_month_interval,
                         MeasurementType.PRODUCED_ENERGY,
                         device_info,
+                        ENERGY_PERIOD_LAST_MONTH,
                     )
                 )
 
@@ -306,39 +348,61 @@ async def async_setup_entry(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        energy_interval,
                         MeasurementType.ENERGY,
                         device_info,
                     )
                 )
                 devices.append(
-                    NgenicEnergyThisMonthSensor(
+                    NgenicEnergySensor(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        energy_this_month_interval,
                         MeasurementType.ENERGY,
                         device_info,
+                        ENERGY_PERIOD_THIS_MONTH,
                     )
                 )
                 devices.append(
-                    NgenicEnergyLastMonthSensor(
+                    NgenicEnergySensor(
                         hass,
                         ngenic,
                         node_room,
-                        node,
+                        coordinator,
                         node_name,
+                        energy_last_month_interval,
                         MeasurementType.ENERGY,
                         device_info,
+                        ENERGY_PERIOD_LAST_MONTH,
                     )
                 )
 
+            if coordinator.update_interval is not None:
+                # The coordinator has sensors to fetch measurements for
+                coordinators.append(coordinator)
+
     # Add entities to hass
     async_add_entities(devices)
 
+    for delay, coordinator in enumerate(coordinators):
+        # Fetch the node measurements at startup, a second apart
+        # The coordinator will then keep them updated
+        # Coordinators tick on whole seconds, so this also keeps the nodes
+        # from being fetched at the same time on every later tick
+        config_entry.async_on_unload(
+            async_call_later(hass, delay, coordinator.async_scheduled_refresh)
+        )
+
     for device in devices:
+        if isinstance(device, NgenicSensor):
+            # Updated by the node coordinator
+            continue
+
         if device.should_update_on_startup:
             # Update the device state at startup
             await device.async_update()
@@ -1,35 +1,57 @@
 """The sensors package."""
 
+from datetime import datetime
+from functools import lru_cache
 import logging
 
+from ngenicpy.models.measurement import MeasurementType
 from ngenicpy.models.node import Node
 
 import homeassistant.util.dt as dt_util
 
-TIME_ZONE = (
-    "Z" if str(dt_util.DEFAULT_TIME_ZONE) == "UTC" else str(dt_util.DEFAULT_TIME_ZONE)
-)
-
 _LOGGER = logging.getLogger(__name__)
 
 
+def format_api_datetime(value: datetime) -> str:
+    """Format a datetime for the measurement API.
+
+    The datetime is formatted in ISO 8601:2004 as UTC, since
+    the `+` of an UTC offset would be read as a space when
+    passed in the query string.
+    """
+    return dt_util.as_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache
+def measurement_type_display(measurement_type: MeasurementType) -> str:
+    """Get the measurement type as used in sensor names.
+
+    Measurement types are enum members, so the result is cached.
+    """
+    return measurement_type.name.replace("_", " ")
+
+
 async def get_measurement_value(node: Node, **kwargs) -> int:
     """Get measurement.
 
     This is a wrapper around the measurement API to gather
     parsing and error handling in a single place.
+
+    Measurements are only fetched when the coordinator of the node finds
+    the sensor due, so the client cache is always bypassed. Otherwise a
+    sensor updated more often than the client cache expires would be
+    given the same measurement again.
     """
 
-    measurement = await node.async_measurement(**kwargs)
+    measurement = await node.async_measurement(invalidate_cache=True, **kwargs)
 
     if not measurement:
         # measurement API will return None if no measurements were found for the period
         _LOGGER.info(
-            "Measurement not found for period, this is expected when data have not been gathered for the period (type=%s, from=%s, to=%s, invalidate_cache=%s)",
+            "Measurement not found for period, this is expected when data have not been gathered for the period (type=%s, from=%s, to=%s)",
             kwargs.get("measurement_type", "unknown"),
             kwargs.get("from_dt", "None"),
             kwargs.get("to_dt", "None"),
-            kwargs.get("invalidate_cache", "False"),
         )
         measurement_val = 0
     elif isinstance(measurement, list):
@@ -7,16 +7,12 @@ from ngenicpy import AsyncNgenic
 from ngenicpy.models.tune import Tune
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo, slugify
 
-from ..const import (  # noqa: TID252
-    BRAND,
-    DOMAIN,
-    SETPONT_SCHEDULE_NAME,
-    UPDATE_SCHEDULE_TOPIC,
-)
+from ..const import BRAND, DOMAIN, UPDATE_SCHEDULE_TOPIC  # noqa: TID252
+from ..schedule import async_get_away_schedule  # noqa: TID252
 from .base import SlimNgenicSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,21 +50,36 @@ class NgenicBaseAwaySensor(SlimNgenicSensor):
 
         self._tune = tune
 
+    @property
+    def state(self) -> str | None:
+        """Return the state of the sensor.
+
+        The state is already formatted, so the value
+        is not validated against the device class.
+        """
+        return self._state
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         _LOGGER.debug("Registering callbacks for %s", self.unique_id)
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, UPDATE_SCHEDULE_TOPIC, self._force_update
+                self.hass, UPDATE_SCHEDULE_TOPIC, self._async_schedule_updated
             )
         )
 
+    @callback
+    def _async_schedule_updated(self, tune_uuid: str) -> None:
+        """Update the sensor when the away schedule of a tune has changed."""
+        if tune_uuid == self._tune.uuid():
+            self._async_schedule_force_update()
+
 
 class NgenicAwayModeSensor(NgenicBaseAwaySensor):
     """Representation of a Ngenic Away Mode Sensor."""
 
-    device_class = SensorDeviceClass.ENUM
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:home-off"
 
     def __init__(
@@ -84,8 +95,8 @@ class NgenicAwayModeSensor(NgenicBaseAwaySensor):
 
     async def _async_fetch_measurement(self, first_load: bool = False):
         if isinstance(self._tune, Tune):
-            schedule = await self._tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, not first_load
+            schedule = await async_get_away_schedule(
+                self._hass, self._tune, not first_load
             )
             return "Active" if schedule.active() else "Inactive"
         return None
@@ -94,8 +105,8 @@ class NgenicAwayModeSensor(NgenicBaseAwaySensor):
 class NgenicAwayScheduledFromSensor(NgenicBaseAwaySensor):
     """Representation of a Ngenic AwayScheduled From Sensor."""
 
-    device_class = SensorDeviceClass.TIMESTAMP
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
         self,
@@ -111,8 +122,8 @@ class NgenicAwayScheduledFromSensor(NgenicBaseAwaySensor):
     async def _async_fetch_measurement(self, first_load: bool = False):
         val: str | None = None
         if isinstance(self._tune, Tune):
-            schedule = await self._tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, not first_load
+            schedule = await async_get_away_schedule(
+                self._hass, self._tune, not first_load
             )
             try:
                 val = schedule.start_time().isoformat()
@@ -124,8 +135,8 @@ class NgenicAwayScheduledFromSensor(NgenicBaseAwaySensor):
 class NgenicAwayScheduledToSensor(NgenicBaseAwaySensor):
     """Representation of a Ngenic Away Scheduled To Sensor."""
 
-    device_class = SensorDeviceClass.TIMESTAMP
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
         self,
@@ -141,8 +152,8 @@ class NgenicAwayScheduledToSensor(NgenicBaseAwaySensor):
     async def _async_fetch_measurement(self, first_load: bool = False):
         val: str | None = None
         if isinstance(self._tune, Tune):
-            schedule = await self._tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, not first_load
+            schedule = await async_get_away_schedule(
+                self._hass, self._tune, not first_load
             )
             try:
                 val = schedule.end_time().isoformat()
@@ -1,23 +1,40 @@
 """Base class for Ngenic sensors."""
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import logging
+from time import monotonic
 from typing import Any
 
 from ngenicpy import AsyncNgenic
 from ngenicpy.models.measurement import MeasurementType
-from ngenicpy.models.node import Node
+from ngenicpy.models.node import Node, NodeStatus
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+import homeassistant.util.dt as dt_util
 
 from . import get_measurement_value
 
 _LOGGER = logging.getLogger(__name__)
 
+# intervals skipped at most after a failed fetch
+MAX_SKIPPED_FETCHES = 5
+
+# consecutive failed fetches before a sensor is made unavailable
+UNAVAILABLE_AFTER_FAILURES = 3
+
+# seconds a sensor may be fetched before it is due, as the coordinator
+# ticks on whole seconds and may fire slightly early
+FETCH_SLACK = 5.0
+
 
 class SlimNgenicSensor(SensorEntity):
     """Representation of a Slim Ngenic Sensor."""
@@ -36,32 +53,24 @@ class SlimNgenicSensor(SensorEntity):
         self._state = None
         self._available = False
         self._updater = None
+        self._force_update_task: asyncio.Task | None = None
         self._hass = hass
         self._ngenic = ngenic
-        self._unique_id = unique_id
         self._name = name
+        self._attr_unique_id = unique_id
+        self._attr_name = name.title()
         self._update_interval = update_interval
         self._attr_device_info = device_info
         self._should_update_on_startup = should_update_on_startup
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for the sensor."""
-        return self._unique_id
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self._name.title()
-
     @property
     def available(self) -> bool:
         """Return if the sensor is available."""
         return self._available
 
     @property
-    def state(self) -> int | None:
-        """Return the state of the sensor."""
+    def native_value(self) -> Any:
+        """Return the value of the sensor."""
         return self._state
 
     @property
@@ -83,6 +92,17 @@ class SlimNgenicSensor(SensorEntity):
         await self.async_update()
         self.async_write_ha_state()
 
+    @callback
+    def _async_schedule_force_update(self) -> None:
+        """Schedule a forced update unless one is already running.
+
+        Being a callback, the dispatcher runs this inline
+        instead of creating a task for every signal.
+        """
+        if self._force_update_task is not None and not self._force_update_task.done():
+            return
+        self._force_update_task = self.hass.async_create_task(self._force_update())
+
     async def async_will_remove_from_hass(self) -> None:
         """Remove updater when sensor is removed."""
         if self._updater:
@@ -110,10 +130,12 @@ class SlimNgenicSensor(SensorEntity):
 
         This is the only method that should fetch new data for Home Assistant.
         """
-        _LOGGER.debug(
-            "Fetch measurement (sensor=%s)",
-            self.unique_id,
-        )
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "Fetch measurement (sensor=%s)",
+                self.unique_id,
+            )
         try:
             new_state = await self._async_fetch_measurement(first_load)
             self._available = True
@@ -126,11 +148,12 @@ class SlimNgenicSensor(SensorEntity):
 
         if self._state != new_state:
             self._state = new_state
-            _LOGGER.debug(
-                "New measurement: %s (sensor=%s)",
-                new_state,
-                self.unique_id,
-            )
+            if debug:
+                _LOGGER.debug(
+                    "New measurement: %s (sensor=%s)",
+                    new_state,
+                    self.unique_id,
+                )
 
             # self.hass is loaded once the entity have been setup.
             # Since this method is executed before adding the entity
@@ -138,7 +161,7 @@ class SlimNgenicSensor(SensorEntity):
             if self.hass:
                 # Tell hass that an update is available
                 self.schedule_update_ha_state()
-        else:
+        elif debug:
             _LOGGER.debug(
                 "No new measurement: %s (sensor=%s)",
                 self._state,
@@ -146,15 +169,135 @@ class SlimNgenicSensor(SensorEntity):
             )
 
 
-class NgenicSensor(SlimNgenicSensor):
-    """Representation of a Ngenic Sensor."""
+class NgenicNodeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinator fetching the measurements of all sensors of a single node.
+
+    The coordinator ticks when the next sensor is due, and every tick
+    fetches the measurements of those sensors whose own update interval
+    has elapsed, concurrently and in a single pass.
+    The node status is fetched at most once per tick.
+
+    Data is keyed by the unique ID of each sensor. A sensor is missing
+    from the data until it has been successfully fetched.
+
+    When fetching a sensor fails, it is fetched less often until it
+    succeeds again. The last measurement is kept for the first failures,
+    so a short outage doesn't make the sensor unavailable.
+    """
+
+    def __init__(self, hass: HomeAssistant, node: Node) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, name=f"Ngenic node {node.uuid()}")
+        self.node = node
+        self._sensors: list[NgenicSensor] = []
+        self._next_fetch: dict[str, float] = {}
+        self._failures: dict[str, int] = {}
+        self._status_task: asyncio.Task | None = None
+
+        # local time of the current update, shared by all sensors fetched in it
+        self.update_time: datetime = dt_util.now()
+
+    def add_sensor(self, sensor: "NgenicSensor") -> None:
+        """Add a sensor whose measurement should be fetched by this coordinator."""
+        self._sensors.append(sensor)
+
+        if sensor.should_update_on_startup:
+            self._next_fetch[sensor.unique_id] = 0.0
+        else:
+            # Wait 1 minute before fetching the measurement
+            # This is to ensure the Ngenic API not responds with "429 Too Many Requests" error
+            self._next_fetch[sensor.unique_id] = monotonic() + 60.0
+
+        # until the first refresh, tick at the shortest update interval
+        if (
+            self.update_interval is None
+            or sensor.update_interval < self.update_interval
+        ):
+            self.update_interval = sensor.update_interval
+
+    async def async_status(self) -> NodeStatus | None:
+        """Get the node status.
+
+        The status is shared by all sensors fetched in the same tick.
+        """
+        if self._status_task is None:
+            self._status_task = self.hass.async_create_task(self.node.async_status())
+        return await self._status_task
+
+    async def async_scheduled_refresh(self, _now: datetime) -> None:
+        """Refresh the data when scheduled by a timer."""
+        await self.async_refresh()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the measurements of all sensors that are due."""
+        self._status_task = None
+        self.update_time = dt_util.now()
+        data = dict(self.data or {})
+        now = monotonic()
+
+        deadline = now + FETCH_SLACK
+        sensors = [
+            sensor
+            for sensor in self._sensors
+            if self._next_fetch[sensor.unique_id] <= deadline
+        ]
+
+        results = await asyncio.gather(
+            *(
+                sensor._async_fetch_measurement(sensor.unique_id not in data)  # noqa: SLF001
+                for sensor in sensors
+            ),
+            return_exceptions=True,
+        )
+
+        for sensor, result in zip(sensors, results, strict=True):
+            unique_id = sensor.unique_id
+            interval = sensor.update_interval.total_seconds()
+            if isinstance(result, BaseException):
+                # Don't fail the whole node if a sensor fails to update.
+                # Instead, skip a growing number of intervals and make the
+                # sensor unavailable if it keeps failing.
+                failures = self._failures.get(unique_id, 0) + 1
+                self._failures[unique_id] = failures
+                _LOGGER.error(
+                    "Failed to update (sensor=%s, failures=%s)",
+                    unique_id,
+                    failures,
+                    exc_info=result,
+                )
+                self._next_fetch[unique_id] = now + interval * (
+                    1 + min(failures, MAX_SKIPPED_FETCHES)
+                )
+                if failures >= UNAVAILABLE_AFTER_FAILURES:
+                    data.pop(unique_id, None)
+            else:
+                self._failures.pop(unique_id, None)
+                self._next_fetch[unique_id] = now + interval
+                data[unique_id] = result
+
+        # tick again when the next sensor is due, so every sensor is
+        # fetched at its own update interval
+        self.update_interval = timedelta(
+            seconds=max(min(self._next_fetch.values()) - monotonic(), 1.0)
+        )
+
+        return data
+
+
+class NgenicSensor(CoordinatorEntity[NgenicNodeCoordinator], SlimNgenicSensor):
+    """Representation of a Ngenic Sensor.
+
+    Measurements are fetched by the coordinator of the node.
+    """
+
+    _unique_id_suffix = "sensor"
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room | None,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
         update_interval: timedelta,
         measurement_type: MeasurementType | str,
@@ -162,8 +305,11 @@ class NgenicSensor(SlimNgenicSensor):
         should_update_on_startup: bool = False,
     ) -> None:
         """Initialize the sensor."""
+        node = coordinator.node
 
-        super().__init__(
+        super().__init__(coordinator)
+        SlimNgenicSensor.__init__(
+            self,
             hass,
             ngenic,
             f"{node.uuid()}-{
@@ -172,7 +318,7 @@ class NgenicSensor(SlimNgenicSensor):
                     if isinstance(measurement_type, MeasurementType)
                     else measurement_type
                 )
-            }-sensor",
+            }-{self._unique_id_suffix}",
             name,
             update_interval,
             device_info,
@@ -181,15 +327,43 @@ class NgenicSensor(SlimNgenicSensor):
 
         self._node = node
         self._measurement_type = measurement_type
+        self._attr_name = f"{name} {self.device_class}".replace("_", " ").title()
 
         self._attributes = {}
         if room is not None:
             self._attributes["room_uuid"] = room.uuid()
 
+        # availability and state when the state was last written
+        self._written: tuple[bool, Any] | None = None
+
+        coordinator.add_sensor(self)
+
     @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self._name} {self.device_class}".replace("_", " ").title()
+    def update_interval(self) -> timedelta:
+        """Return how often the measurement should be fetched."""
+        return self._update_interval
+
+    @property
+    def available(self) -> bool:
+        """Return if the sensor is available."""
+        return super().available and self._available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        The coordinator updates all sensors of the node on every tick,
+        but only some of them are fetched. The state is only written
+        when it has changed.
+        """
+        self._available = self.unique_id in self.coordinator.data
+        self._state = self.coordinator.data.get(self.unique_id)
+
+        written = (self.available, self._state)
+        if written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self):
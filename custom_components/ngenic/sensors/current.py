@@ -4,7 +4,6 @@ from datetime import timedelta
 
 from ngenicpy import AsyncNgenic
 from ngenicpy.models.measurement import MeasurementType
-from ngenicpy.models.node import Node
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -12,23 +11,26 @@ from homeassistant.const import UnitOfElectricCurrent
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
-from . import get_measurement_value
-from .base import NgenicSensor
+from . import get_measurement_value, measurement_type_display
+from .base import NgenicNodeCoordinator, NgenicSensor
 
 
 class NgenicCurrentSensor(NgenicSensor):
     """Representation of an Ngenic Current Sensor."""
 
-    device_class = SensorDeviceClass.CURRENT
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.CURRENT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+    _attr_suggested_display_precision = 1
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
+        update_interval: timedelta,
         measurement_type: MeasurementType,
         device_info: DeviceInfo,
     ) -> None:
@@ -38,27 +40,21 @@ class NgenicCurrentSensor(NgenicSensor):
             hass,
             ngenic,
             room,
-            node,
+            coordinator,
             name,
-            timedelta(minutes=2),
+            update_interval,
             measurement_type,
             device_info,
             True,
         )
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{self._name} {self._measurement_type.name.replace('_', ' ')}".title()
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return UnitOfElectricCurrent.AMPERE
+        self._attr_name = (
+            f"{self._name} {measurement_type_display(self._measurement_type)}".title()
+        )
 
     async def _async_fetch_measurement(self, first_load: bool = False):
         """Fetch new electric current state data for the sensor."""
         val = await get_measurement_value(
-            self._node, measurement_type=self._measurement_type, invalidate_cache=True
+            self._node, measurement_type=self._measurement_type
         )
-        return round(val, 1)
+        return val
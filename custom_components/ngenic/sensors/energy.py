@@ -1,92 +1,178 @@
 """Ngenic Energy Sensor."""
 
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import NamedTuple
 
 from ngenicpy import AsyncNgenic
 from ngenicpy.models.measurement import MeasurementType
-from ngenicpy.models.node import Node
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
+import homeassistant.util.dt as dt_util
 
-from . import TIME_ZONE, get_measurement_value
-from .base import NgenicSensor
+from . import format_api_datetime, get_measurement_value, measurement_type_display
+from .base import NgenicNodeCoordinator, NgenicSensor
 
+# Periods are local to the configured time zone and sent to the API in UTC,
+# which will handle DST correctly.
+# When asking for measurements, the `from` datetime is inclusive
+# and the `to` datetime is exclusive.
 
-def _get_from_to_datetime(days=1):
+
+def _get_from_to_datetime(now: datetime, days=1) -> tuple[datetime, datetime]:
     """Get a period.
 
-    This will return two dates in ISO 8601:2004 format
-    The first date will be at 00:00 today, and the second
-    date will be at 00:00 n days ahead of now.
+    The first date will be at 00:00 the day of `now`, and the second
+    date will be at 00:00 n days ahead of that.
+    """
+    from_dt = dt_util.start_of_local_day(now)
+    to_dt = from_dt + timedelta(days=days)
+
+    return (from_dt, to_dt)
+
 
-    Both dates include the time zone name, or `Z` in case of UTC.
-    Including these will allow the API to handle DST correctly.
+def _get_from_to_datetime_month(now: datetime) -> tuple[datetime, datetime]:
+    """Get a period for the month of `now`.
 
-    When asking for measurements, the `from` datetime is inclusive
-    and the `to` datetime is exclusive.
+    The first date will be at 00:00 in the first of this month, and the second
+    date will be at 00:00 in the first day in the following month, as we are measuring historic
+    data a month back and forward to todays date its not
+    an issue that the we have a future end date.
     """
-    from_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    to_dt = from_dt + timedelta(days=days)
+    return _get_from_to_datetime_given_month(now.year, now.month, now.tzinfo)
+
+
+@lru_cache(maxsize=4)
+def _get_from_to_datetime_given_month(
+    year: int, month: int, time_zone: tzinfo
+) -> tuple[datetime, datetime]:
+    """Get the period for the given month."""
+    from_dt = datetime(year, month, 1, tzinfo=time_zone)
+    to_dt = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=time_zone)
+    return (from_dt, to_dt)
+
+
+def _get_from_to_datetime_last_month(now: datetime) -> tuple[datetime, datetime]:
+    """Get a period for the month before the month of `now`.
+
+    The first date will be at 00:00 in the first of last month, and the second
+    date will be at 00:00 in the first day in this month.
+    """
+    return _get_from_to_datetime_month_before(now.year, now.month, now.tzinfo)
+
+
+@lru_cache(maxsize=4)
+def _get_from_to_datetime_month_before(
+    year: int, month: int, time_zone: tzinfo
+) -> tuple[datetime, datetime]:
+    """Get the period for the month before the given month."""
+    to_dt = datetime(year, month, 1, tzinfo=time_zone)
+    from_dt = datetime(
+        year + (month - 2) // 12, (month - 2) % 12 + 1, 1, tzinfo=time_zone
+    )
+    return (from_dt, to_dt)
+
+
+class EnergyPeriod(NamedTuple):
+    """The period an energy sensor is measuring."""
+
+    period_fn: Callable[[datetime], tuple[datetime, datetime]]
+    label: str | None
+    unique_id_suffix: str
+    state_class: SensorStateClass | None
 
-    return (from_dt.isoformat() + " " + TIME_ZONE, to_dt.isoformat() + " " + TIME_ZONE)
+
+ENERGY_PERIOD_DAY = EnergyPeriod(
+    _get_from_to_datetime, None, "sensor", SensorStateClass.TOTAL_INCREASING
+)
+ENERGY_PERIOD_THIS_MONTH = EnergyPeriod(
+    _get_from_to_datetime_month, "monthly", "sensor-month", None
+)
+ENERGY_PERIOD_LAST_MONTH = EnergyPeriod(
+    _get_from_to_datetime_last_month, "last month", "sensor-last-month", None
+)
 
 
 class NgenicEnergySensor(NgenicSensor):
     """Representation of an Ngenic Energy Sensor."""
 
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_suggested_display_precision = 1
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
+        update_interval: timedelta,
         measurement_type: MeasurementType,
         device_info: DeviceInfo,
+        period: EnergyPeriod = ENERGY_PERIOD_DAY,
     ) -> None:
         """Initialize the sensor."""
+        # the unique id is built from the suffix when initializing the base class
+        self._unique_id_suffix = period.unique_id_suffix
 
         super().__init__(
             hass,
             ngenic,
             room,
-            node,
+            coordinator,
             name,
-            timedelta(minutes=10),
+            update_interval,
             measurement_type,
             device_info,
-            True,
+            period is ENERGY_PERIOD_DAY,
         )
 
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return UnitOfEnergy.KILO_WATT_HOUR
+        self._period_fn = period.period_fn
+        self._attr_state_class = period.state_class
+        self._attr_name = " ".join(
+            filter(
+                None, (name, period.label, measurement_type_display(measurement_type))
+            )
+        ).title()
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{self._name} {self._measurement_type.name.replace('_', ' ').title()}"
+        # the final value of a period that has ended, and the start of that period
+        self._final_value = None
+        self._final_from_dt: datetime | None = None
 
     async def _async_fetch_measurement(self, first_load: bool = False):
         """Ask for measurements for a duration.
 
         This requires some further inputs, so we'll override the _async_fetch_measurement method.
+
+        The total of a period can't change once it is over, so it's
+        only fetched until a final value has been fetched.
         """
-        from_dt, to_dt = _get_from_to_datetime()
+        now = self.coordinator.update_time
+        from_dt, to_dt = self._period_fn(now)
+        if self._final_from_dt == from_dt:
+            return self._final_value
+
         # using datetime will return a list of measurements
         # we'll use the last item in that list
         current = await get_measurement_value(
             self._node,
             measurement_type=self._measurement_type,
-            from_dt=from_dt,
-            to_dt=to_dt,
+            from_dt=format_api_datetime(from_dt),
+            to_dt=format_api_datetime(to_dt),
         )
-        return round(current, 1)
+
+        if current and now >= to_dt + timedelta(days=1):
+            # measurements from the end of the period
+            # have been gathered by the next day.
+            # 0 is returned when no measurement was found, which
+            # could be a temporary gap, so it's fetched again
+            self._final_value = current
+            self._final_from_dt = from_dt
+
+        return current
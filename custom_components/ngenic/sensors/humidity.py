@@ -4,28 +4,29 @@ from datetime import timedelta
 
 from ngenicpy import AsyncNgenic
 from ngenicpy.models.measurement import MeasurementType
-from ngenicpy.models.node import Node
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
-from .base import NgenicSensor
+from .base import NgenicNodeCoordinator, NgenicSensor
 
 
 class NgenicHumiditySensor(NgenicSensor):
     """Representation of an Ngenic Humidity Sensor."""
 
-    device_class = SensorDeviceClass.HUMIDITY
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
         measurement_type: MeasurementType,
         device_info: DeviceInfo,
@@ -36,15 +37,10 @@ class NgenicHumiditySensor(NgenicSensor):
             hass,
             ngenic,
             room,
-            node,
+            coordinator,
             name,
             timedelta(minutes=5),
             measurement_type,
             device_info,
             True,
         )
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return "%"
@@ -4,7 +4,6 @@ from datetime import timedelta
 
 from ngenicpy import AsyncNgenic
 from ngenicpy.models.measurement import MeasurementType
-from ngenicpy.models.node import Node
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -12,22 +11,24 @@ from homeassistant.const import UnitOfPower
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
-from . import get_measurement_value
-from .base import NgenicSensor
+from . import get_measurement_value, measurement_type_display
+from .base import NgenicNodeCoordinator, NgenicSensor
 
 
 class NgenicPowerSensor(NgenicSensor):
     """Representation of an Ngenic Power Sensor."""
 
-    device_class = SensorDeviceClass.POWER
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _attr_suggested_display_precision = 1
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
         measurement_type: MeasurementType,
         device_info: DeviceInfo,
@@ -38,7 +39,7 @@ class NgenicPowerSensor(NgenicSensor):
             hass,
             ngenic,
             room,
-            node,
+            coordinator,
             name,
             timedelta(minutes=2),
             measurement_type,
@@ -46,15 +47,9 @@ class NgenicPowerSensor(NgenicSensor):
             True,
         )
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{self._name} {self._measurement_type.name.replace('_', ' ')}".title()
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return UnitOfPower.WATT
+        self._attr_name = (
+            f"{self._name} {measurement_type_display(self._measurement_type)}".title()
+        )
 
     async def _async_fetch_measurement(self, first_load: bool = False):
         """Fetch new power state data for the sensor.
@@ -62,6 +57,6 @@ class NgenicPowerSensor(NgenicSensor):
         The NGenic API returns a float with kW but HA huses W so we need to multiply by 1000
         """
         current = await get_measurement_value(
-            self._node, measurement_type=self._measurement_type, invalidate_cache=True
+            self._node, measurement_type=self._measurement_type
         )
         return round(current * 1000.0, 1)
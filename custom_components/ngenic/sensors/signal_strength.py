@@ -4,14 +4,14 @@ from datetime import timedelta
 import logging
 
 from ngenicpy import AsyncNgenic
-from ngenicpy.models.node import Node, NodeStatus
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
-from .base import NgenicSensor
+from .base import NgenicNodeCoordinator, NgenicSensor
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,15 +19,16 @@ _LOGGER = logging.getLogger(__name__)
 class NgenicSignalStrengthSensor(NgenicSensor):
     """Representation of an Ngenic Signal Strength Sensor."""
 
-    device_class = SensorDeviceClass.SIGNAL_STRENGTH
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
         device_info: DeviceInfo,
     ) -> None:
@@ -37,26 +38,18 @@ class NgenicSignalStrengthSensor(NgenicSensor):
             hass,
             ngenic,
             room,
-            node,
+            coordinator,
             name,
             timedelta(minutes=5),
             "SIGNAL",
             device_info,
         )
 
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return "%"
-
     async def _async_fetch_measurement(self, first_load: bool = False):
-        if isinstance(self._node, Node):
-            status = await self._node.async_status()
+        status = await self.coordinator.async_status()
 
-        if isinstance(status, NodeStatus):
-            current = status.radio_signal_percentage()
-        else:
+        if status is None:
             _LOGGER.debug("Assume signal is full if we can't get the status")
-            current = 100
+            return 100
 
-        return current
+        return status.radio_signal_percentage()
@@ -4,7 +4,6 @@ from datetime import timedelta
 
 from ngenicpy import AsyncNgenic
 from ngenicpy.models.measurement import MeasurementType
-from ngenicpy.models.node import Node
 from ngenicpy.models.room import Room
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -12,22 +11,23 @@ from homeassistant.const import UnitOfElectricPotential
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
-from . import get_measurement_value
-from .base import NgenicSensor
+from . import get_measurement_value, measurement_type_display
+from .base import NgenicNodeCoordinator, NgenicSensor
 
 
 class NgenicVoltageSensor(NgenicSensor):
     """Representation of an Ngenic Voltage Sensor."""
 
-    device_class = SensorDeviceClass.VOLTAGE
-    state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.VOLTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
 
     def __init__(
         self,
         hass: HomeAssistant,
         ngenic: AsyncNgenic,
         room: Room,
-        node: Node,
+        coordinator: NgenicNodeCoordinator,
         name: str,
         measurement_type: MeasurementType,
         device_info: DeviceInfo,
@@ -38,26 +38,20 @@ class NgenicVoltageSensor(NgenicSensor):
             hass,
             ngenic,
             room,
-            node,
+            coordinator,
             name,
             timedelta(minutes=2),
             measurement_type,
             device_info,
         )
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{self._name} {self._measurement_type.name.replace('_', ' ')}".title()
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return UnitOfElectricPotential.VOLT
+        self._attr_name = (
+            f"{self._name} {measurement_type_display(self._measurement_type)}".title()
+        )
 
     async def _async_fetch_measurement(self, first_load: bool = False):
         """Fetch new voltage state data for the sensor."""
         val = await get_measurement_value(
-            self._node, measurement_type=self._measurement_type, invalidate_cache=True
+            self._node, measurement_type=self._measurement_type
         )
         return round(val, 1)
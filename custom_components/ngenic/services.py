@@ -1,18 +1,24 @@
 """Set active control service for Ngenic integration."""
 
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+import logging
 
 from ngenicpy import AsyncNgenic
+from ngenicpy.models.setpoint_schedule import SetpointSchedule
+from ngenicpy.models.tune import Tune
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.service import verify_domain_control
+from homeassistant.util.async_ import gather_with_limited_concurrency
 import homeassistant.util.dt as dt_util
 
 from .const import (
     DATA_CLIENT,
+    DATA_SERVICES_REGISTERED,
     DOMAIN,
     SERVICE_ACTIVATE_AWAY,
     SERVICE_DEACTIVATE_AWAY,
@@ -21,101 +27,157 @@ from .const import (
     SETPONT_SCHEDULE_NAME,
     UPDATE_SCHEDULE_TOPIC,
 )
+from .schedule import async_refresh_away_schedule
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of tunes updated at the same time by a service call
+MAX_CONCURRENT_TUNES = 10
+
+
+def _with_time_zone(value: datetime) -> datetime:
+    """Give a datetime without a time zone the configured time zone."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return value
+
+
+async def _async_update_tunes(
+    ngenic: AsyncNgenic, update_tune: Callable[[Tune], Awaitable[None]]
+) -> None:
+    """Update all tunes concurrently.
+
+    A failing tune doesn't stop the others from being updated.
+    Every failure is logged, and the first one is raised to the caller.
+    """
+    tunes = await ngenic.async_tunes()
+    results = await gather_with_limited_concurrency(
+        MAX_CONCURRENT_TUNES,
+        *(update_tune(tune) for tune in tunes),
+        return_exceptions=True,
+    )
+
+    errors: list[BaseException] = []
+    for tune, result in zip(tunes, results, strict=True):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Failed to update (tune=%s)", tune.uuid(), exc_info=result)
+            errors.append(result)
+    if errors:
+        raise errors[0]
 
 
 def async_register_services(hass: HomeAssistant):
     """Register services for Ngenic integration."""
+    if hass.data[DOMAIN].get(DATA_SERVICES_REGISTERED):
+        return
 
     async def set_active_control(service) -> None:
         """Set active control."""
         room_uuid = service.data["room_uuid"]
         active = service.data.get("active", False)
         ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
-        for tune in await ngenic.async_tunes():
-            rooms = await tune.async_rooms()
-            for room in rooms:
-                if room.uuid() == room_uuid:
-                    room["activeControl"] = active
-                    await room.async_update()
+
+        # fetch the rooms of all tunes at once, then update the matching room
+        tune_rooms = await gather_with_limited_concurrency(
+            MAX_CONCURRENT_TUNES,
+            *(tune.async_rooms() for tune in await ngenic.async_tunes()),
+        )
+        room = next(
+            (
+                room
+                for rooms in tune_rooms
+                for room in rooms
+                if room.uuid() == room_uuid
+            ),
+            None,
+        )
+        if room is not None:
+            room["activeControl"] = active
+            await room.async_update()
+
+    async def update_away_schedules(
+        update_schedule: Callable[[SetpointSchedule], None],
+    ) -> None:
+        """Update the away schedule of all tunes."""
+        ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
+
+        async def update_tune_away_schedule(tune: Tune) -> None:
+            schedule = await tune.async_setpoint_schedule(SETPONT_SCHEDULE_NAME)
+            update_schedule(schedule)
+            await schedule.async_update()
+            # revalidate cache, the away entities will share the fetched schedule
+            await async_refresh_away_schedule(hass, tune)
+            hass.loop.call_soon(
+                async_dispatcher_send, hass, UPDATE_SCHEDULE_TOPIC, tune.uuid()
+            )
+
+        await _async_update_tunes(ngenic, update_tune_away_schedule)
 
     async def set_away_schedule(service) -> None:
         """Set away schedule."""
         start_time: datetime = service.data["start_time"]
         end_time: datetime = service.data["end_time"]
-        start_time_tz = start_time.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-        end_time_tz = end_time.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-        ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
-        for tune in await ngenic.async_tunes():
-            schedule = await tune.async_setpoint_schedule(SETPONT_SCHEDULE_NAME)
-            schedule.set_schedule(start_time_tz, end_time_tz)
-            await schedule.async_update()
-            schedule = await tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, True
-            )  # revalidate cache
-            async_dispatcher_send(hass, UPDATE_SCHEDULE_TOPIC)
+        await update_away_schedules(
+            lambda schedule: schedule.set_schedule(start_time, end_time)
+        )
 
     async def activate_away(service) -> None:
         """Activate away."""
-        ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
-        for tune in await ngenic.async_tunes():
-            schedule = await tune.async_setpoint_schedule(SETPONT_SCHEDULE_NAME)
-            schedule.activate_away()
-            await schedule.async_update()
-            schedule = await tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, True
-            )  # revalidate cache
-            async_dispatcher_send(hass, UPDATE_SCHEDULE_TOPIC)
+        await update_away_schedules(SetpointSchedule.activate_away)
 
     async def deactivate_away(service) -> None:
         """Deactivate away."""
-        ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
-        for tune in await ngenic.async_tunes():
-            schedule = await tune.async_setpoint_schedule(SETPONT_SCHEDULE_NAME)
-            schedule.deactivate_away()
-            await schedule.async_update()
-            schedule = await tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, True
-            )  # revalidate cache
-            async_dispatcher_send(hass, UPDATE_SCHEDULE_TOPIC)
+        await update_away_schedules(SetpointSchedule.deactivate_away)
 
     # Register services
 
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_ACTIVE_CONTROL):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_ACTIVE_CONTROL,
-            verify_domain_control(DOMAIN)(set_active_control),
-            schema=vol.Schema(
-                {
-                    vol.Required("room_uuid"): cv.string,
-                    vol.Required("active"): cv.boolean,
-                }
-            ),
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ACTIVE_CONTROL,
+        verify_domain_control(DOMAIN)(set_active_control),
+        schema=vol.Schema(
+            {
+                vol.Required("room_uuid"): cv.string,
+                vol.Required("active"): cv.boolean,
+            }
+        ),
+    )
 
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_AWAY_SCHEDULE):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_AWAY_SCHEDULE,
-            verify_domain_control(DOMAIN)(set_away_schedule),
-            schema=vol.Schema(
-                {
-                    vol.Required("start_time"): cv.datetime,
-                    vol.Required("end_time"): cv.datetime,
-                }
-            ),
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_AWAY_SCHEDULE,
+        verify_domain_control(DOMAIN)(set_away_schedule),
+        schema=vol.Schema(
+            {
+                vol.Required("start_time"): vol.All(cv.datetime, _with_time_zone),
+                vol.Required("end_time"): vol.All(cv.datetime, _with_time_zone),
+            }
+        ),
+    )
 
-    if not hass.services.has_service(DOMAIN, SERVICE_ACTIVATE_AWAY):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_ACTIVATE_AWAY,
-            verify_domain_control(DOMAIN)(activate_away),
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ACTIVATE_AWAY,
+        verify_domain_control(DOMAIN)(activate_away),
+    )
 
-    if not hass.services.has_service(DOMAIN, SERVICE_DEACTIVATE_AWAY):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_DEACTIVATE_AWAY,
-            verify_domain_control(DOMAIN)(deactivate_away),
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DEACTIVATE_AWAY,
+        verify_domain_control(DOMAIN)(deactivate_away),
+    )
+
+    hass.data[DOMAIN][DATA_SERVICES_REGISTERED] = True
+
+
+def async_unregister_services(hass: HomeAssistant):
+    """Unregister services for Ngenic integration."""
+    for service in (
+        SERVICE_SET_ACTIVE_CONTROL,
+        SERVICE_SET_AWAY_SCHEDULE,
+        SERVICE_ACTIVATE_AWAY,
+        SERVICE_DEACTIVATE_AWAY,
+    ):
+        hass.services.async_remove(DOMAIN, service)
+
+    hass.data[DOMAIN].pop(DATA_SERVICES_REGISTERED, None)
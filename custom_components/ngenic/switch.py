@@ -1,5 +1,6 @@
 """Switch for Ngenic integration."""
 
+import asyncio
 import logging
 
 from ngenicpy import AsyncNgenic
@@ -8,6 +9,7 @@ from ngenicpy.models.tune import Tune
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
@@ -15,13 +17,8 @@ from homeassistant.helpers.dispatcher import (
 from homeassistant.helpers.entity import Callable, DeviceInfo, HomeAssistant
 from homeassistant.util import slugify
 
-from .const import (
-    BRAND,
-    DATA_CLIENT,
-    DOMAIN,
-    SETPONT_SCHEDULE_NAME,
-    UPDATE_SCHEDULE_TOPIC,
-)
+from .const import BRAND, DATA_CLIENT, DOMAIN, UPDATE_SCHEDULE_TOPIC
+from .schedule import async_get_away_schedule, async_refresh_away_schedule
 
 _LOGGER = logging.getLogger(__package__)
 
@@ -32,20 +29,19 @@ async def async_setup_entry(
     """Seting up Ngenic switches."""
 
     ngenic: AsyncNgenic = hass.data[DOMAIN][DATA_CLIENT]
-    devices = [NgenicAwayModeSwitch(tune) for tune in await ngenic.async_tunes()]
+    devices = [NgenicAwayModeSwitch(hass, tune) for tune in await ngenic.async_tunes()]
 
-    for device in devices:
-        # Initial update (will not update hass state)
-        await device.async_update(True)
+    # Initial update of all switches at once (will not update hass state)
+    await asyncio.gather(*(device.async_update(True) for device in devices))
 
-    # Add entities to hass (and trigger a state update)
-    async_add_entities(devices, update_before_add=True)
+    # Add entities to hass, their state is already up to date
+    async_add_entities(devices)
 
 
 class NgenicAwayModeSwitch(SwitchEntity):
     """Representation of a Ngenic away mode switch."""
 
-    def __init__(self, tune: Tune) -> None:
+    def __init__(self, hass: HomeAssistant, tune: Tune) -> None:
         """Initialize the switch."""
 
         device_info_name = f"Ngenic Tune {tune['tuneName']}"
@@ -62,6 +58,7 @@ class NgenicAwayModeSwitch(SwitchEntity):
             name=device_info_name,
             model="Tune",
         )
+        self._hass = hass
         self._tune = tune
         self._schedule: SetpointSchedule = None
         _LOGGER.debug("Init done for %s", self.unique_id)
@@ -73,7 +70,12 @@ class NgenicAwayModeSwitch(SwitchEntity):
         else:
             self._schedule.deactivate_away()
         await self._schedule.async_update()
-        async_dispatcher_send(self.hass, UPDATE_SCHEDULE_TOPIC)
+        # revalidate, the away entities will share the fetched schedule
+        self._schedule = await async_refresh_away_schedule(self._hass, self._tune)
+        # Tell the away entities to update once this coroutine has returned
+        self.hass.loop.call_soon(
+            async_dispatcher_send, self.hass, UPDATE_SCHEDULE_TOPIC, self._tune.uuid()
+        )
 
     async def async_turn_on(self):
         """Turn the switch on."""
@@ -88,16 +90,22 @@ class NgenicAwayModeSwitch(SwitchEntity):
         _LOGGER.debug("Registering callbacks for %s", self.unique_id)
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, UPDATE_SCHEDULE_TOPIC, self.async_update
+                self.hass, UPDATE_SCHEDULE_TOPIC, self._async_schedule_updated
             )
         )
 
+    @callback
+    def _async_schedule_updated(self, tune_uuid: str) -> None:
+        """Update the switch when the away schedule of a tune has changed."""
+        if tune_uuid == self._tune.uuid():
+            self.hass.async_create_task(self.async_update())
+
     async def async_update(self, first_load: bool = False) -> None:
         """Fetch new state data for the switch."""
 
         try:
-            self._schedule = await self._tune.async_setpoint_schedule(
-                SETPONT_SCHEDULE_NAME, not first_load
+            self._schedule = await async_get_away_schedule(
+                self._hass, self._tune, not first_load
             )
         except Exception:
             # Don't throw an exception if a sensor fails to update.
@@ -114,7 +122,7 @@ class NgenicAwayModeSwitch(SwitchEntity):
 
             if self.hass:
                 # Tell hass that an update is available
-                self.schedule_update_ha_state()
+                self.async_write_ha_state()
         else:
             _LOGGER.debug(
                 "No new state: %s (switch=%s)",